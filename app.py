@@ -1,3 +1,9 @@
+import itertools
+
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 
 import pandas as pd
@@ -27,11 +33,50 @@ st.markdown("""
 
 
 
-def load_data():
-    df = pd.read_csv("cleaned_aircrashes_2024.csv")
+DATA_PATH = "cleaned_aircrashes_2024.csv"
+
+# --- Sidebar filters: (label, column) ---
+FILTERS = [
+    ("Year", "Year"),
+    ("Country", "Country/Region"),
+    ("Continent", "Continent"),
+    ("Quarter", "Quarter"),
+]
+FILTER_COLUMNS = [column for _, column in FILTERS]
+
+
+@st.cache_data(max_entries=1)
+def load_data(version):
+    # `version` is the csv modification time, so an updated file reloads
+    df = pd.read_csv(DATA_PATH)
     return df
 
-df = load_data()
+
+@st.cache_resource(max_entries=1)
+def build_filter_index(version):
+    # Co-occurrence index, built once per dataset version:
+    # index[column][selections of the other filters] -> {option: row count},
+    # where an unset filter is keyed as "All".
+    df = load_data(version)
+    index = {}
+    for column in FILTER_COLUMNS:
+        others = [c for c in FILTER_COLUMNS if c != column]
+        index[column] = {}
+        for mask in itertools.product([False, True], repeat=len(others)):
+            fixed = [c for c, keep in zip(others, mask) if keep]
+            counts = df.groupby(fixed + [column]).size().reset_index()
+            for *values, option, count in counts.itertuples(index=False, name=None):
+                chosen = dict(zip(fixed, values))
+                key = tuple(chosen.get(c, "All") for c in others)
+                index[column].setdefault(key, {})[option] = count
+        for key, options in index[column].items():
+            index[column][key] = dict(sorted(options.items()))
+    return index
+
+
+data_version = os.path.getmtime(DATA_PATH)
+df = load_data(data_version)
+filter_index = build_filter_index(data_version)
 
 # --- HEADER ---
 
@@ -42,33 +87,55 @@ st.caption(
 
 # --- SIDEBAR FILTERS ---
 st.sidebar.header("🔎 Filter Crashes")
-# --- Year Dropdown ---
-year = st.sidebar.selectbox(
-    "Select Year:",
-    options= ["All"] + sorted(df["Year"].dropna().unique())
-)
-# --- Country Dropdown ---
-country = st.sidebar.selectbox(
-    "Select Country:",
-    options= ["All"] + sorted(df["Country/Region"].dropna().unique())
-)
-# --- Continent Dropdown ---
-continent = st.sidebar.selectbox(
-    "Select Continent:",
-    options= ["All"] + sorted(df["Continent"].dropna().unique())
-)
-# --- Quarter Dropdown ---
-quarter = st.sidebar.selectbox(
-    "Select Quarter:",
-    options= ["All"] + sorted(df["Quarter"].dropna().unique())
-)
+# Each dropdown only lists values that co-occur with the other selections,
+# so an empty combination can never be picked.
+# The chosen values are kept under `sel_<column>`, which no widget owns: a
+# selectbox gets a new identity whenever its options change, and would
+# otherwise fall back to "All".
+def remember_selection(column):
+    st.session_state[f"sel_{column}"] = st.session_state[f"filter_{column}"]
+
+
+def filter_counts(column, selections):
+    # Row count per option of `column`, given the other filters' selections
+    others = tuple(selections[c] for c in FILTER_COLUMNS if c != column)
+    return filter_index[column].get(others, {})
+
+
+selections = {c: st.session_state.get(f"sel_{c}", "All") for c in FILTER_COLUMNS}
+# Reset persisted selections that no longer co-occur (e.g. after the csv
+# changes). This runs in FILTERS order: a reset only widens the others'
+# options, so filters already checked stay valid, but when two selections
+# conflict it is the later one that falls back to "All".
+for column in FILTER_COLUMNS:
+    if selections[column] != "All" and selections[column] not in filter_counts(column, selections):
+        selections[column] = "All"
+        st.session_state[f"sel_{column}"] = "All"
+
+for label, column in FILTERS:
+    key = f"filter_{column}"
+    counts = filter_counts(column, selections)
+    st.session_state[key] = selections[column]
+    st.sidebar.selectbox(
+        f"Select {label}:",
+        options=["All"] + list(counts),
+        format_func=lambda option, counts=counts: (
+            f"{option} ({sum(counts.values()) if option == 'All' else counts[option]:,})"
+        ),
+        key=key,
+        on_change=remember_selection,
+        args=(column,),
+    )
+year = selections["Year"]
+country = selections["Country/Region"]
+continent = selections["Continent"]
+quarter = selections["Quarter"]
+
 # --- APPLY FILTERS ---
-filtered_df = df[
-    (df["Country/Region"] == country) &
-    (df["Year"] == year) &
-    (df["Quarter"] == quarter) &
-    (df["Continent"] == continent)
-]
+filtered_df = df
+for column, value in selections.items():
+    if value != "All":
+        filtered_df = filtered_df[filtered_df[column] == value]
 
 
 # KPI section
@@ -83,16 +150,6 @@ total_crashes_all = len(df)
 survivors_all = int(df["Survivors"].sum())
 
 # --- Filtered totals ---
-filtered_df = df.copy()
-if country != "All":
-    filtered_df = filtered_df[filtered_df["Country/Region"] == country]
-if year != "All":
-    filtered_df = filtered_df[filtered_df["Year"] == year]
-if quarter != "All":
-    filtered_df = filtered_df[filtered_df["Quarter"] == quarter]
-if continent != "All":
-    filtered_df = filtered_df[filtered_df["Continent"] == continent]  
-
 total_aboard_filt = int(filtered_df["Aboard"].sum())
 total_fatalities_filt = int(filtered_df["Fatalities (air)"].sum())
 ground_fatalities_filt = int(filtered_df["Ground"].sum())
@@ -152,512 +209,573 @@ for col, kpi in zip(cols, kpis_filtered):
     """, unsafe_allow_html=True)
 
 
-    
-st.markdown("### *1. How have global air crashes occurrences changed over time from 1908–2024 ?*")
+# --- ANALYSIS SECTIONS ---
+# Each section builds its figure from the shared filtered view without
+# mutating it; derived columns live in local variables only.
 
-# Use filtered data
-data = filtered_df.copy()
- # Group by Year
-yearly_trend = data.groupby("Year").size().reset_index(name="Crash_Count")
 
-fig = px.line(
-    yearly_trend,
-    x="Year",
-    y="Crash_Count",
-    title="📈 Global Air Crash Occurrences (1908–2024)",
-    markers=True,
-    line_shape='linear',
-)
+def yearly_crash_chart(data):
+    # Crash counts per year.
+    # Group by Year
+    yearly_trend = data.groupby("Year").size().reset_index(name="Crash_Count")
 
+    fig = px.line(
+        yearly_trend,
+        x="Year",
+        y="Crash_Count",
+        title="📈 Global Air Crash Occurrences (1908–2024)",
+        markers=True,
+        line_shape='linear',
+    )
 
-fig.update_traces(line=dict(color='#3F51B5', width=3), marker=dict(color='#00BCD4', size=6))
 
-# Style layout
-fig.update_layout(
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    xaxis_title="Year",
-    yaxis_title="Number of Crashes",
-    title_font_size=20,
-)
+    fig.update_traces(line=dict(color='#3F51B5', width=3), marker=dict(color='#00BCD4', size=6))
 
-st.plotly_chart(fig, use_container_width=True)
+    # Style layout
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Year",
+        yaxis_title="Number of Crashes",
+        title_font_size=20,
+    )
 
+    return fig
 
-st.markdown("### *2. Which decades recorded the highest number of air crash fatalities worldwide ?*")
 
-# Use filtered data
-data = filtered_df.copy()
-# Create Decade column
-data["Decade"] = (data["Year"] // 10) * 10
+def decade_fatalities_chart(data):
+    # Air and ground fatalities per decade.
+    # Decade of each crash
+    decade = ((data["Year"] // 10) * 10).rename("Decade")
 
-# Total fatalities (air + ground)
-data["Total_Fatalities"] = data["Fatalities (air)"] + data["Ground"]
+    # Total fatalities (air + ground)
+    total_fatalities = (data["Fatalities (air)"] + data["Ground"]).rename("Total_Fatalities")
 
-# Group by Decade
-decade_fatalities = (
-    data.groupby("Decade")["Total_Fatalities"]
-    .sum()
-    .reset_index()
-)
+    # Group by Decade
+    decade_fatalities = (
+        total_fatalities.groupby(decade)
+        .sum()
+        .reset_index()
+    )
 
-# Plot bar chart
-fig = px.bar(
-    decade_fatalities,
-    x="Decade",
-    y="Total_Fatalities",
-    title="💀 Worldwide air crash fatalities by decades ",
-)
+    # Plot bar chart
+    fig = px.bar(
+        decade_fatalities,
+        x="Decade",
+        y="Total_Fatalities",
+        title="💀 Worldwide air crash fatalities by decades ",
+    )
 
-# Color styling (fatalities-focused, clear and readable)
-fig.update_traces(
-    marker=dict(color="#E91E63")  # Pink / Fatalities color
-)
+    # Color styling (fatalities-focused, clear and readable)
+    fig.update_traces(
+        marker=dict(color="#E91E63")  # Pink / Fatalities color
+    )
 
-# Layout styling for Streamlit
-fig.update_layout(
-    plot_bgcolor="rgba(0,0,0,0)",
-    paper_bgcolor="rgba(0,0,0,0)",
-    xaxis_title="Decade",
-    yaxis_title="Total Fatalities (Air + Ground)",
-    title_font_size=20,
-    yaxis=dict(showgrid=True, gridcolor="#E0E0E0"),
-    xaxis=dict(showgrid=False),
-)
+    # Layout styling for Streamlit
+    fig.update_layout(
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        xaxis_title="Decade",
+        yaxis_title="Total Fatalities (Air + Ground)",
+        title_font_size=20,
+        yaxis=dict(showgrid=True, gridcolor="#E0E0E0"),
+        xaxis=dict(showgrid=False),
+    )
 
-st.plotly_chart(fig, use_container_width=True)
+    return fig
 
 
+def day_of_week_chart(data):
+    # Crash share by day of the week.
+    # Extract day of week
+    day_of_week = pd.to_datetime(data["Date"]).dt.day_name()
 
-st.markdown("### *3. Is there a signicant relationship between the day of the week and air crash occurrences?*")
+    # Order days properly
+    day_order = [
+        "Monday", "Tuesday", "Wednesday",
+        "Thursday", "Friday", "Saturday", "Sunday"
+    ]
 
-# Use filtered data
-data = filtered_df.copy()
-# Ensure date column is datetime
-data["Date"] = pd.to_datetime(data["Date"])
+    # Count crashes per day
+    day_counts = (
+        day_of_week
+        .value_counts()
+        .reindex(day_order)
+        .reset_index()
+    )
 
-# Extract day of week
-data["Day_of_Week"] = data["Date"].dt.day_name()
+    day_counts.columns = ["Day_of_Week", "Crash_Count"]
 
-# Order days properly
-day_order = [
-    "Monday", "Tuesday", "Wednesday",
-    "Thursday", "Friday", "Saturday", "Sunday"
-]
+    # Donut chart
+    fig = px.pie(
+        day_counts,
+        names="Day_of_Week",
+        values="Crash_Count",
+        title="Air Crash Occurrences by Day of the Week",
+        hole=0.45
+    )
 
-# Count crashes per day
-day_counts = (
-    data["Day_of_Week"]
-    .value_counts()
-    .reindex(day_order)
-    .reset_index()
-)
+    # KPI-consistent colors
+    fig.update_traces(
+        marker=dict(colors=[
+            "#3F51B5",  # Indigo
+            "#00BCD4",  # Cyan
+            "#FFC107",  # Amber
+            "#E91E63",  # Pink
+            "#4DD0E1",  # Light Cyan
+            "#9C27B0",  # Purple
+            "#2196F3"   # Blue
+        ]),
+        textinfo="percent+label"
+    )
 
-day_counts.columns = ["Day_of_Week", "Crash_Count"]
+    # Layout styling
+    fig.update_layout(
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        title_font_size=20,
+        legend_title_text="Day of the Week"
+    )
 
-# Donut chart
-fig = px.pie(
-    day_counts,
-    names="Day_of_Week",
-    values="Crash_Count",
-    title="Air Crash Occurrences by Day of the Week",
-    hole=0.45
-)
+    return fig
 
-# KPI-consistent colors
-fig.update_traces(
-    marker=dict(colors=[
-        "#3F51B5",  # Indigo
-        "#00BCD4",  # Cyan
-        "#FFC107",  # Amber
-        "#E91E63",  # Pink
-        "#4DD0E1",  # Light Cyan
-        "#9C27B0",  # Purple
-        "#2196F3"   # Blue
-    ]),
-    textinfo="percent+label"
-)
 
-# Layout styling
-fig.update_layout(
-    plot_bgcolor="rgba(0,0,0,0)",
-    paper_bgcolor="rgba(0,0,0,0)",
-    title_font_size=20,
-    legend_title_text="Day of the Week"
-)
+def top_countries_chart(data):
+    # Top 10 countries by crash count.
+    # Count crashes by Country/Region
+    country_counts = (
+        data["Country/Region"]
+        .value_counts()
+        .head(10)
+        .reset_index()
+    )
 
-st.plotly_chart(fig, use_container_width=True)
+    country_counts.columns = ["Country/Region", "Crash_Count"]
 
+    # Horizontal bar chart
+    fig = px.bar(
+        country_counts,
+        x="Crash_Count",
+        y="Country/Region",
+        orientation="h",
+        title="Top 10 Countries by Number of Air Crashes (Since 1908)",
+    )
 
-st.markdown("### *4. Which countries or regions have experienced the highest number of air crashes since 1908?*")
+    # KPI-consistent colors
+    fig.update_traces(
+        marker=dict(color="#3F51B5")  # Indigo
+    )
 
-# Use filtered data
-data = filtered_df.copy()
-# Count crashes by Country/Region
-country_counts = (
-    data["Country/Region"]
-    .value_counts()
-    .head(10)
-    .reset_index()
-)
+    # Layout styling
+    fig.update_layout(
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        xaxis_title="Number of Air Crashes",
+        yaxis_title="Country / Region",
+        title_font_size=20,
+        yaxis=dict(autorange="reversed"),  # Highest at top
+        xaxis=dict(showgrid=True, gridcolor="#E0E0E0"),
+    )
 
-country_counts.columns = ["Country/Region", "Crash_Count"]
+    return fig
 
-# Horizontal bar chart
-fig = px.bar(
-    country_counts,
-    x="Crash_Count",
-    y="Country/Region",
-    orientation="h",
-    title="Top 10 Countries by Number of Air Crashes (Since 1908)",
-)
 
-# KPI-consistent colors
-fig.update_traces(
-    marker=dict(color="#3F51B5")  # Indigo
-)
+def top_manufacturers_chart(data):
+    # Top 5 manufacturers by crash count.
+    # Count crashes per aircraft manufacturer
+    manufacturer_counts = (
+        data["Aircraft Manufacturer"]
+        .value_counts()
+        .head(5)
+        .reset_index()
+    )
 
-# Layout styling
-fig.update_layout(
-    plot_bgcolor="rgba(0,0,0,0)",
-    paper_bgcolor="rgba(0,0,0,0)",
-    xaxis_title="Number of Air Crashes",
-    yaxis_title="Country / Region",
-    title_font_size=20,
-    yaxis=dict(autorange="reversed"),  # Highest at top
-    xaxis=dict(showgrid=True, gridcolor="#E0E0E0"),
-)
+    manufacturer_counts.columns = ["Manufacturer", "Crash_Count"]
 
-st.plotly_chart(fig, use_container_width=True)
+    # Define a colorful KPI-inspired palette
+    colors = [
+        "#3F51B5",  # Indigo
+        "#00BCD4",  # Cyan
+        "#FFC107",  # Amber
+        "#E91E63",  # Pink
+        "#4DD0E1",  # Light Cyan
+        "#9C27B0",  # Purple
+        "#2196F3",  # Blue
+        "#FF9800",  # Orange
+        "#8BC34A",  # Green
+        "#FF5722",  # Deep Orange
+    ]
+
+    # Funnel chart
+    fig = px.funnel(
+        manufacturer_counts,
+        x="Crash_Count",
+        y="Manufacturer",
+        title="Top 5 Aircraft Manufacturers by Number of Air Crashes Globally"
+    )
 
+    fig.update_traces(marker=dict(color=colors))
 
-st.markdown("### *5. Which aircraft manufacturers are most frequently involved in air crashes globally?*")
+    # Layout styling
+    fig.update_layout(
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        title_font_size=20,
+    )
 
-# Count crashes per aircraft manufacturer
-manufacturer_counts = (
-    data["Aircraft Manufacturer"]
-    .value_counts()
-    .head(5)
-    .reset_index()
-)
+    return fig
 
-manufacturer_counts.columns = ["Manufacturer", "Crash_Count"]
-
-# Define a colorful KPI-inspired palette
-colors = [
-    "#3F51B5",  # Indigo
-    "#00BCD4",  # Cyan
-    "#FFC107",  # Amber
-    "#E91E63",  # Pink
-    "#4DD0E1",  # Light Cyan
-    "#9C27B0",  # Purple
-    "#2196F3",  # Blue
-    "#FF9800",  # Orange
-    "#8BC34A",  # Green
-    "#FF5722",  # Deep Orange
-]
 
-# Funnel chart
-fig = px.funnel(
-    manufacturer_counts,
-    x="Crash_Count",
-    y="Manufacturer",
-    title="Top 5 Aircraft Manufacturers by Number of Air Crashes Globally"
-)
+def aircraft_outcomes_chart(data):
+    # Fatalities and survivors for the 10 deadliest aircraft models.
+    # Aggregate total fatalities and survivors by aircraft model
+    model_stats = (
+        data.groupby("Aircraft")
+        .agg({"Fatalities (air)": "sum", "Survivors": "sum"})
+        .reset_index()
+    )
 
-fig.update_traces(marker=dict(color=colors))
+    # Sort by total fatalities to get top 10 models
+    top_models = model_stats.sort_values(by="Fatalities (air)", ascending=False).head(10)
 
-# Layout styling
-fig.update_layout(
-    plot_bgcolor="rgba(0,0,0,0)",
-    paper_bgcolor="rgba(0,0,0,0)",
-    title_font_size=20,
-)
+    top_models_melted = top_models.melt(
+        id_vars="Aircraft",
+        value_vars=["Fatalities (air)", "Survivors"],
+        var_name="Outcome",
+        value_name="Count"
+    )
 
-st.plotly_chart(fig, use_container_width=True)
+    # Grouped horizontal bar chart
+    fig = px.bar(
+        top_models_melted,
+        x="Count",
+        y="Aircraft",
+        color="Outcome",
+        orientation="h",
+        text="Count",
+        title="Top 10 Aircraft Models by Total Fatalities and Survivors",
+        color_discrete_map={
+            "Fatalities (air)": "#E91E63",  # Pink for fatalities
+            "Survivors": "#00BCD4"          # Cyan for survivors
+        }
+    )
 
+    # Layout styling
+    fig.update_traces(textposition="outside")
+    fig.update_layout(
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        yaxis=dict(autorange="reversed"),  # Highest at top
+        xaxis_title="Count",
+        yaxis_title="Aircraft Model",
+        title_font_size=20
+    )
 
-st.markdown("### *6. Do specific aircraft models tend to be involved in crashes with higher numbers of fatalities or survivors?*")
+    return fig
+
+
+def monthly_survival_chart(data):
+    # Monthly crash counts against survival rate.
+    # Extract month info and total onboard into a local frame
+    dates = pd.to_datetime(data["Date"])
+    monthly = pd.DataFrame({
+        "Month": dates.dt.month_name(),
+        "Month_Num": dates.dt.month,
+        "Survivors": data["Survivors"],
+        "Total_Aboard": data["Survivors"] + data["Fatalities (air)"],
+    })
+
+    # Aggregate monthly data
+    monthly_stats = (
+        monthly.groupby(["Month", "Month_Num"])
+        .agg(
+            Crash_Count=("Month", "size"),
+            Survivors=("Survivors", "sum"),
+            Total_Aboard=("Total_Aboard", "sum")
+        )
+        .reset_index()
+        .sort_values("Month_Num")
+    )
 
-# Use filtered data
-data = filtered_df.copy()
-# Aggregate total fatalities and survivors by aircraft model
-model_stats = (
-    data.groupby("Aircraft")
-    .agg({"Fatalities (air)": "sum", "Survivors": "sum"})
-    .reset_index()
-)
+    # Survival rate
+    monthly_stats["Survival_Rate (%)"] = (
+        monthly_stats["Survivors"] / monthly_stats["Total_Aboard"] * 100
+    )
 
-# Sort by total fatalities to get top 10 models
-top_models = model_stats.sort_values(by="Fatalities (air)", ascending=False).head(10)
+    # Create figure
+    fig = go.Figure()
+
+    # Bar chart: Crash occurrences
+    fig.add_trace(
+        go.Bar(
+            x=monthly_stats["Month"],
+            y=monthly_stats["Crash_Count"],
+            name="Crash Occurrences",
+            marker_color="#26C6DA",  # Bright Teal
+            yaxis="y1"
+        )
+    )
 
-top_models_melted = top_models.melt(
-    id_vars="Aircraft",
-    value_vars=["Fatalities (air)", "Survivors"],
-    var_name="Outcome",
-    value_name="Count"
-)
+    # Line chart: Survival rate
+    fig.add_trace(
+        go.Scatter(
+            x=monthly_stats["Month"],
+            y=monthly_stats["Survival_Rate (%)"],
+            name="Survival Rate (%)",
+            mode="lines+markers",
+            line=dict(color="#FF5252", width=4),  # Coral Red
+            marker=dict(size=8),
+            yaxis="y2"
+        )
+    )
 
-# Grouped horizontal bar chart
-fig = px.bar(
-    top_models_melted,
-    x="Count",
-    y="Aircraft",
-    color="Outcome",
-    orientation="h",
-    text="Count",
-    title="Top 10 Aircraft Models by Total Fatalities and Survivors",
-    color_discrete_map={
-        "Fatalities (air)": "#E91E63",  # Pink for fatalities
-        "Survivors": "#00BCD4"          # Cyan for survivors
-    }
-)
+    # Layout with dual y-axes
+    fig.update_layout(
+        title="Seasonal Variation in Air Crash Occurrences and Survival Rates",
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(title="Month"),
+        yaxis=dict(
+            title="Number of Crashes",
+            showgrid=True,
+            gridcolor="#E0E0E0"
+        ),
+        yaxis2=dict(
+            title="Survival Rate (%)",
+            overlaying="y",
+            side="right",
+            showgrid=False
+        ),
+        legend=dict(x=0.01, y=0.99),
+        title_font_size=20
+    )
 
-# Layout styling
-fig.update_traces(textposition="outside")
-fig.update_layout(
-    plot_bgcolor="rgba(0,0,0,0)",
-    paper_bgcolor="rgba(0,0,0,0)",
-    yaxis=dict(autorange="reversed"),  # Highest at top
-    xaxis_title="Count",
-    yaxis_title="Aircraft Model",
-    title_font_size=20
-)
+    return fig
 
-# Display in Streamlit
-st.plotly_chart(fig, use_container_width=True)
 
+def crash_map_chart(data):
+    # Crash counts per country on a world map.
+    # Aggregate crash counts by country/region
+    country_crashes = (
+        data.groupby("Country/Region")
+        .size()
+        .reset_index(name="Crash_Count")
+    )
 
-st.markdown("### *7.  Do air crash occurrences and survival rates vary across different quarters or months of the year worldwide?*")
+    # Choropleth map
+    fig = px.choropleth(
+        country_crashes,
+        locations="Country/Region",
+        locationmode="country names",
+        color="Crash_Count",
+        hover_name="Country/Region",
+        color_continuous_scale="Turbo",  # Vibrant & attractive
+        title="Global Distribution of Air Crash Occurrences"
+    )
 
-# Use filtered data
-data = filtered_df.copy()
-# Ensure date column is datetime
-data["Date"] = pd.to_datetime(data["Date"])
+    # Layout styling
+    fig.update_layout(
+        geo=dict(
+            showframe=False,
+            showcoastlines=True,
+            projection_type="natural earth"
+        ),
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        title_font_size=20,
+        coloraxis_colorbar=dict(
+            title="Number of Crashes"
+        )
+    )
 
-# Extract month info
-data["Month"] = data["Date"].dt.month_name()
-data["Month_Num"] = data["Date"].dt.month
+    return fig
+
+
+def manufacturer_safety_chart(data):
+    # Safety table for the 15 most frequently involved aircraft.
+    # We aggregate the key metrics by Manufacturer
+    manufacturer_stats = data.groupby("Aircraft").agg(
+        Total_Incidents=("Aircraft", "count"),
+        Total_Fatalities=("Fatalities (air)", "sum"),
+        Total_Survivors=("Survivors", "sum")
+    ).reset_index()
+
+    #  Calculate Survival Rate (%)
+    # Survival Rate = (Survivors / (Survivors + Fatalities)) * 100
+    manufacturer_stats['Survival Rate (%)'] = (
+        (manufacturer_stats['Total_Survivors'] / 
+        (manufacturer_stats['Total_Survivors'] + manufacturer_stats['Total_Fatalities'])) * 100
+    ).fillna(0).round(2)
+
+    # 3. Filter for Top 15 Manufacturers (to keep the table readable)
+    # Sorting by Total Incidents to show the most prominent manufacturers
+    top_manufacturers = manufacturer_stats.nlargest(15, "Total_Incidents")
+
+
+    colorscale = px.colors.sequential.Greens
+    max_rate = top_manufacturers['Survival Rate (%)'].max() or 1
+    cell_colors = [
+        px.colors.sample_colorscale("Greens", [val/100])[0] 
+        for val in top_manufacturers['Survival Rate (%)']
+    ]
+    fig = go.Figure(data=[go.Table(
+        header=dict(
+            values=['<b>Manufacturer</b>', '<b>Total Fatalities</b>', '<b>Total Survivors</b>', '<b>Survival Rate</b>'],
+            fill_color='#2c3e50',
+            align='left',
+            font=dict(color='white', size=12)
+        ),
+        cells=dict(
+            values=[
+                top_manufacturers['Aircraft'],
+                top_manufacturers['Total_Fatalities'],
+                top_manufacturers['Total_Survivors'],
+                top_manufacturers['Survival Rate (%)'].apply(lambda x: f"{x}%")
+            ],
+            # Only the Survival Rate column gets the green gradient
+            fill_color=[
+                'white', 
+                'white', 
+                'white', 
+                cell_colors
+            ],
+            align='left',
+            font=dict(color='black', size=11),
+            height=30
+        )
+    )])
+
+    fig.update_layout(
+        title="Aircraft Manufacturer Safety Performance (Top 15 by Incidents)",
+        margin=dict(l=0, r=0, t=40, b=0)
+    )
 
-# Total onboard
-data["Total_Aboard"] = data["Survivors"] + data["Fatalities (air)"]
+    return fig
 
-# Aggregate monthly data
-monthly_stats = (
-    data.groupby(["Month", "Month_Num"])
-    .agg(
-        Crash_Count=("Month", "size"),
-        Survivors=("Survivors", "sum"),
-        Total_Aboard=("Total_Aboard", "sum")
-    )
-    .reset_index()
-    .sort_values("Month_Num")
-)
 
-# Survival rate
-monthly_stats["Survival_Rate (%)"] = (
-    monthly_stats["Survivors"] / monthly_stats["Total_Aboard"] * 100
-)
+def ground_fatalities_chart(data):
+    # Yearly share of crashes with ground fatalities.
+    # Extract Year from Date
+    year = pd.to_datetime(data['Date']).dt.year.rename('Year')
+
+    # Logic: Count an incident if 'Ground' fatalities > 0
+    has_ground_fatalities = data['Ground'] > 0
 
-# Create figure
-fig = go.Figure()
+    # Aggregate data by Year
+    yearly_data = has_ground_fatalities.groupby(year).agg(
+        Total_Crashes='count',
+        Crashes_With_Ground_Fatalities='sum'
+    ).reset_index()
 
-# Bar chart: Crash occurrences
-fig.add_trace(
-    go.Bar(
-        x=monthly_stats["Month"],
-        y=monthly_stats["Crash_Count"],
-        name="Crash Occurrences",
-        marker_color="#26C6DA",  # Bright Teal
-        yaxis="y1"
+    # Calculate the actual Proportion (%)
+    yearly_data['Proportion (%)'] = (
+        (yearly_data['Crashes_With_Ground_Fatalities'] / yearly_data['Total_Crashes']) * 100
+    ).round(2)
+
+    fig = px.area(
+        yearly_data,
+        x="Year",
+        y="Proportion (%)",
+        title="Percentage of Air Crashes Involving Ground Fatalities",
+        labels={"Proportion (%)": "Proportion of Total Crashes (%)", "Year": "Year of Incident"},
+        color_discrete_sequence=["#EF553B"], # A warm, alert red-orange
+        template="plotly_white"
     )
-)
 
-# Line chart: Survival rate
-fig.add_trace(
-    go.Scatter(
-        x=monthly_stats["Month"],
-        y=monthly_stats["Survival_Rate (%)"],
-        name="Survival Rate (%)",
-        mode="lines+markers",
-        line=dict(color="#FF5252", width=4),  # Coral Red
-        marker=dict(size=8),
-        yaxis="y2"
+    fig.update_layout(
+        hovermode="x unified",
+        xaxis=dict(showgrid=False),
+        yaxis=dict(ticksuffix="%", showgrid=True, gridcolor='rgba(0,0,0,0.1)'),
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)"
     )
-)
 
-# Layout with dual y-axes
-fig.update_layout(
-    title="Seasonal Variation in Air Crash Occurrences and Survival Rates",
-    plot_bgcolor="rgba(0,0,0,0)",
-    paper_bgcolor="rgba(0,0,0,0)",
-    xaxis=dict(title="Month"),
-    yaxis=dict(
-        title="Number of Crashes",
-        showgrid=True,
-        gridcolor="#E0E0E0"
-    ),
-    yaxis2=dict(
-        title="Survival Rate (%)",
-        overlaying="y",
-        side="right",
-        showgrid=False
-    ),
-    legend=dict(x=0.01, y=0.99),
-    title_font_size=20
-)
+    # Add a trend line (Optional: smoothing out the noise)
+    fig.update_traces(line_color="#B22222", line_width=2, fillcolor="rgba(239, 85, 59, 0.3)")
 
-st.plotly_chart(fig, use_container_width=True)
+    return fig, yearly_data
 
 
+SECTIONS = [
+    yearly_crash_chart,
+    decade_fatalities_chart,
+    day_of_week_chart,
+    top_countries_chart,
+    top_manufacturers_chart,
+    aircraft_outcomes_chart,
+    monthly_survival_chart,
+    crash_map_chart,
+    manufacturer_safety_chart,
+    ground_fatalities_chart,
+]
 
-st.markdown("### *8. How are air crash occurrences geographically distributed across countries and regions worldwide?*")
 
-# Use filtered data
-data = filtered_df.copy()
-# Aggregate crash counts by country/region
-country_crashes = (
-    data.groupby("Country/Region")
-    .size()
-    .reset_index(name="Crash_Count")
-)
+@st.cache_resource
+def get_section_executor():
+    # One bounded pool shared by every session, so concurrent reruns queue
+    # instead of spawning threads per user.
+    # Note: most of each section's time is Plotly figure building, which holds
+    # the GIL, so on this dataset the pool is no faster than running the ten
+    # sections in sequence (~0.5 s either way).
+    return ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) + 4),
+        thread_name_prefix="section",
+    )
 
-# Choropleth map
-fig = px.choropleth(
-    country_crashes,
-    locations="Country/Region",
-    locationmode="country names",
-    color="Crash_Count",
-    hover_name="Country/Region",
-    color_continuous_scale="Turbo",  # Vibrant & attractive
-    title="Global Distribution of Air Crash Occurrences"
-)
 
-# Layout styling
-fig.update_layout(
-    geo=dict(
-        showframe=False,
-        showcoastlines=True,
-        projection_type="natural earth"
-    ),
-    plot_bgcolor="rgba(0,0,0,0)",
-    paper_bgcolor="rgba(0,0,0,0)",
-    title_font_size=20,
-    coloraxis_colorbar=dict(
-        title="Number of Crashes"
-    )
-)
+# Build all sections concurrently, then render them in order on this thread
+executor = get_section_executor()
+futures = {section: executor.submit(section, filtered_df) for section in SECTIONS}
 
-st.plotly_chart(fig, use_container_width=True)
+# A rerun or stop raises at the next st.* call; cancel what has not started so
+# discarded work does not hold up other sessions on the shared pool
+try:
+    st.markdown("### *1. How have global air crashes occurrences changed over time from 1908–2024 ?*")
+    st.plotly_chart(futures[yearly_crash_chart].result(), use_container_width=True)
 
 
+    st.markdown("### *2. Which decades recorded the highest number of air crash fatalities worldwide ?*")
+    st.plotly_chart(futures[decade_fatalities_chart].result(), use_container_width=True)
 
-st.markdown("### *9. Aircraft manufacturer, total fatalities and survival rate*")
 
-# We aggregate the key metrics by Manufacturer
-manufacturer_stats = data.groupby("Aircraft").agg(
-    Total_Incidents=("Aircraft", "count"),
-    Total_Fatalities=("Fatalities (air)", "sum"),
-    Total_Survivors=("Survivors", "sum")
-).reset_index()
+    st.markdown("### *3. Is there a signicant relationship between the day of the week and air crash occurrences?*")
+    st.plotly_chart(futures[day_of_week_chart].result(), use_container_width=True)
 
-#  Calculate Survival Rate (%)
-# Survival Rate = (Survivors / (Survivors + Fatalities)) * 100
-manufacturer_stats['Survival Rate (%)'] = (
-    (manufacturer_stats['Total_Survivors'] / 
-    (manufacturer_stats['Total_Survivors'] + manufacturer_stats['Total_Fatalities'])) * 100
-).fillna(0).round(2)
 
-# 3. Filter for Top 15 Manufacturers (to keep the table readable)
-# Sorting by Total Incidents to show the most prominent manufacturers
-top_manufacturers = manufacturer_stats.nlargest(15, "Total_Incidents")
+    st.markdown("### *4. Which countries or regions have experienced the highest number of air crashes since 1908?*")
+    st.plotly_chart(futures[top_countries_chart].result(), use_container_width=True)
 
 
-colorscale = px.colors.sequential.Greens
-max_rate = top_manufacturers['Survival Rate (%)'].max() or 1
-cell_colors = [
-    px.colors.sample_colorscale("Greens", [val/100])[0] 
-    for val in top_manufacturers['Survival Rate (%)']
-]
-fig = go.Figure(data=[go.Table(
-    header=dict(
-        values=['<b>Manufacturer</b>', '<b>Total Fatalities</b>', '<b>Total Survivors</b>', '<b>Survival Rate</b>'],
-        fill_color='#2c3e50',
-        align='left',
-        font=dict(color='white', size=12)
-    ),
-    cells=dict(
-        values=[
-            top_manufacturers['Aircraft'],
-            top_manufacturers['Total_Fatalities'],
-            top_manufacturers['Total_Survivors'],
-            top_manufacturers['Survival Rate (%)'].apply(lambda x: f"{x}%")
-        ],
-        # Only the Survival Rate column gets the green gradient
-        fill_color=[
-            'white', 
-            'white', 
-            'white', 
-            cell_colors
-        ],
-        align='left',
-        font=dict(color='black', size=11),
-        height=30
-    )
-)])
-
-fig.update_layout(
-    title="Aircraft Manufacturer Safety Performance (Top 15 by Incidents)",
-    margin=dict(l=0, r=0, t=40, b=0)
-)
+    st.markdown("### *5. Which aircraft manufacturers are most frequently involved in air crashes globally?*")
+    st.plotly_chart(futures[top_manufacturers_chart].result(), use_container_width=True)
 
-st.plotly_chart(fig, use_container_width=True)
 
+    st.markdown("### *6. Do specific aircraft models tend to be involved in crashes with higher numbers of fatalities or survivors?*")
+    st.plotly_chart(futures[aircraft_outcomes_chart].result(), use_container_width=True)
 
-st.markdown("### *10. What proportion of air crashes result in ground fatalities, and how has this changed over time?*")
 
-# Convert Date and extract Year
-data['Date'] = pd.to_datetime(data['Date'])
-data['Year'] = data['Date'].dt.year
+    st.markdown("### *7.  Do air crash occurrences and survival rates vary across different quarters or months of the year worldwide?*")
+    st.plotly_chart(futures[monthly_survival_chart].result(), use_container_width=True)
 
-# Logic: Count an incident if 'Ground' fatalities > 0
-data['Has_Ground_Fatalities'] = data['Ground'] > 0
 
-# Aggregate data by Year
-yearly_data = data.groupby('Year').agg(
-    Total_Crashes=('Has_Ground_Fatalities', 'count'),
-    Crashes_With_Ground_Fatalities=('Has_Ground_Fatalities', 'sum')
-).reset_index()
+    st.markdown("### *8. How are air crash occurrences geographically distributed across countries and regions worldwide?*")
+    st.plotly_chart(futures[crash_map_chart].result(), use_container_width=True)
 
-# Calculate the actual Proportion (%)
-yearly_data['Proportion (%)'] = (
-    (yearly_data['Crashes_With_Ground_Fatalities'] / yearly_data['Total_Crashes']) * 100
-).round(2)
 
-st.subheader("Evolution of Ground Fatality Proportions")
+    st.markdown("### *9. Aircraft manufacturer, total fatalities and survival rate*")
+    st.plotly_chart(futures[manufacturer_safety_chart].result(), use_container_width=True)
 
-fig = px.area(
-    yearly_data,
-    x="Year",
-    y="Proportion (%)",
-    title="Percentage of Air Crashes Involving Ground Fatalities",
-    labels={"Proportion (%)": "Proportion of Total Crashes (%)", "Year": "Year of Incident"},
-    color_discrete_sequence=["#EF553B"], # A warm, alert red-orange
-    template="plotly_white"
-)
 
-fig.update_layout(
-    hovermode="x unified",
-    xaxis=dict(showgrid=False),
-    yaxis=dict(ticksuffix="%", showgrid=True, gridcolor='rgba(0,0,0,0.1)'),
-    plot_bgcolor="rgba(0,0,0,0)",
-    paper_bgcolor="rgba(0,0,0,0)"
-)
+    st.markdown("### *10. What proportion of air crashes result in ground fatalities, and how has this changed over time?*")
+
+    fig, yearly_data = futures[ground_fatalities_chart].result()
 
-# Add a trend line (Optional: smoothing out the noise)
-fig.update_traces(line_color="#B22222", line_width=2, fillcolor="rgba(239, 85, 59, 0.3)")
+    st.subheader("Evolution of Ground Fatality Proportions")
 
-st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True)
+finally:
+    for future in futures.values():
+        future.cancel()
 
 # Contextual Metrics ---
 col1, col2 = st.columns(2)
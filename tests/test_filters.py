@@ -0,0 +1,35 @@
+from streamlit.testing.v1 import AppTest
+
+
+def run_app():
+    at = AppTest.from_file("../app.py", default_timeout=60)
+    return at.run()
+
+
+def select(at, column, value):
+    # Options are labelled "<value> (<row count>)"
+    box = at.selectbox(key=f"filter_{column}")
+    index = next(i for i, option in enumerate(box.options) if option.startswith(f"{value} ("))
+    return box.select_index(index).run()
+
+
+def test_filters_combine():
+    at = run_app()
+    at = select(at, "Country/Region", "France")
+    at = select(at, "Quarter", "Qtr 1")
+    at = select(at, "Continent", "Europe")
+
+    assert at.session_state["sel_Country/Region"] == "France"
+    assert at.session_state["sel_Quarter"] == "Qtr 1"
+    assert at.session_state["sel_Continent"] == "Europe"
+    assert at.session_state["sel_Year"] == "All"
+    assert at.selectbox(key="filter_Year").options[0] == "All (43)"
+
+
+def test_year_keeps_country():
+    at = run_app()
+    at = select(at, "Country/Region", "France")
+    at = select(at, "Year", 1950)
+
+    assert at.session_state["sel_Country/Region"] == "France"
+    assert at.session_state["sel_Year"] == 1950